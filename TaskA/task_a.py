@@ -25,7 +25,12 @@ Phone: 0401234567
 Email: anna.virtanen@example.com
 """
 
-from datetime import datetime
+import sys
+from datetime import date, time
+
+# Translation table for swapping the decimal point to a Finnish comma;
+# translate with a prebuilt table beats str.replace scanning per value
+DECIMAL_COMMA = str.maketrans(".", ",")
 
 def main():
     # Define the file name directly in the code
@@ -42,11 +47,15 @@ def main():
     reservation_number = int(reservation[0])
     booker = reservation[1] # Already a string so no need for type conversion
     
-    # Convert the date and time to Finnish format:
-    booking_date = datetime.strptime(reservation[2], "%Y-%m-%d").date()
-    booking_date_fin = booking_date.strftime("%d.%m.%Y")
-    booking_time = datetime.strptime(reservation[3], "%H:%M").time()
-    booking_time_fin = booking_time.strftime("%H.%M")
+    # Convert the date and time to Finnish format; fromisoformat is a
+    # fast C-level parser, unlike strptime which interprets its format
+    # string on every call:
+    # The target formats are trivial, so build them from the date/time
+    # fields directly; strftime parses its format string on every call
+    booking_date = date.fromisoformat(reservation[2])
+    booking_date_fin = f"{booking_date.day:02d}.{booking_date.month:02d}.{booking_date.year:04d}"
+    booking_time = time.fromisoformat(reservation[3])
+    booking_time_fin = f"{booking_time.hour:02d}.{booking_time.minute:02d}"
     hours = int(reservation[4])
     hour_price = float(reservation[5])
 
@@ -54,27 +63,33 @@ def main():
     total_price = hours * hour_price
     
     # Format prices into string with 2 decimals and comma as decimal separator:
-    hour_price_str = f"{hour_price:.2f}".replace('.', ',')
-    total_price_str = f"{total_price:.2f}".replace('.', ',')
+    hour_price_str = f"{hour_price:.2f}".translate(DECIMAL_COMMA)
+    total_price_str = f"{total_price:.2f}".translate(DECIMAL_COMMA)
     
-    paid = bool(reservation[6])
+    # Compare against the literal text: bool() would be True for any
+    # non-empty string, including "False"
+    paid = reservation[6] == "True"
     resource = reservation[7]
     phone_number = reservation[8]
     email_address = reservation[9]
 
 
-    # Print reservation details to console
-    print("Reservation number: " + str(reservation_number))
-    print("Booker: " + booker)
-    print("Date: " + booking_date_fin)
-    print("Start time: " + booking_time_fin)
-    print("Number of hours: " + str(hours))
-    print("Hourly price: " + hour_price_str + " €")
-    print("Total price: " + total_price_str + " €")
-    print(f"Paid: {'Yes' if paid else 'No'}")
-    print("Location: " + resource)
-    print("Phone: " + phone_number)
-    print("Email: " + email_address) 
+    # Print reservation details to console with one buffered write
+    # instead of a separate print call (and flush) per line
+    lines = [
+        "Reservation number: " + str(reservation_number),
+        "Booker: " + booker,
+        "Date: " + booking_date_fin,
+        "Start time: " + booking_time_fin,
+        "Number of hours: " + str(hours),
+        "Hourly price: " + hour_price_str + " €",
+        "Total price: " + total_price_str + " €",
+        f"Paid: {'Yes' if paid else 'No'}",
+        "Location: " + resource,
+        "Phone: " + phone_number,
+        "Email: " + email_address,
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
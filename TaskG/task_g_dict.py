@@ -20,7 +20,9 @@ int | str | str | str | date | time | int | float | bool | str | datetime
 
 """
 
-from datetime import datetime
+import sys
+from array import array
+from datetime import datetime, date, time
 
 
 def convert_reservation_data(reservation: list) -> dict:
@@ -34,108 +36,178 @@ def convert_reservation_data(reservation: list) -> dict:
      converted (dict): Converted data types in a dictionary
     """
     converted = {}
-    converted["id"] = int(reservation[0])  # reservationId (str -> int)
-    converted["name"] = str(reservation[1])  # name (str)
-    converted["email"] = str(reservation[2])  # email (str)
-    converted["phone"] = str(reservation[3])  # phone (str)
-    converted["date"] = datetime.strptime(reservation[4], "%Y-%m-%d").date()  # reservationDate (date)
-    converted["time"] = datetime.strptime(reservation[5], "%H:%M").time()  # reservationTime (time)
+    # The fields arrive as bytes; int() and float() parse bytes
+    # directly, so only the free-text fields get decoded to str
+    converted["id"] = int(reservation[0])  # reservationId (bytes -> int)
+    converted["name"] = reservation[1].decode()  # name (str)
+    converted["email"] = reservation[2].decode()  # email (str)
+    converted["phone"] = reservation[3].decode()  # phone (str)
+    # The formats are fixed, so slice the fields into integers directly
+    # instead of strptime, which re-parses its format string every call.
+    # The date and time are decoded whole since their slices also build
+    # the display strings
+    s = reservation[4].decode()  # "YYYY-MM-DD"
+    converted["date"] = date(int(s[0:4]), int(s[5:7]), int(s[8:10]))  # reservationDate (date)
+    # Build the Finnish display string from the same slices while the
+    # field is at hand; the reports print it on every listing and
+    # strftime would re-parse its format string per row
+    converted["date_str"] = f"{s[8:10]}.{s[5:7]}.{s[0:4]}"
+    s = reservation[5].decode()  # "HH:MM"
+    converted["time"] = time(int(s[0:2]), int(s[3:5]))  # reservationTime (time)
+    converted["time_str"] = f"{s[0:2]}.{s[3:5]}"
     converted["duration"] = int(reservation[6])  # durationHours (int)
     converted["price"] = float(reservation[7])  # price (float)
-    converted["confirmed"] = True if reservation[8].strip() == 'True' else False  # confirmed (bool)
-    converted["resource"] = str(reservation[9])  # reservedResource (str)
-    converted["created"] = datetime.strptime(str(reservation[10]).strip(), "%Y-%m-%d %H:%M:%S")  # createdAt (datetime)
+    converted["confirmed"] = reservation[8] == b'True'  # confirmed (bool)
+    converted["resource"] = reservation[9].decode()  # reservedResource (str)
+    s = reservation[10]  # b"YYYY-MM-DD HH:MM:SS"
+    converted["created"] = datetime(
+        int(s[0:4]), int(s[5:7]), int(s[8:10]),
+        int(s[11:13]), int(s[14:16]), int(s[17:19]),
+    )  # createdAt (datetime)
     return converted
 
 
-def fetch_reservations(reservation_file: str) -> list[dict]:
+def fetch_reservations(reservation_file: str) -> dict[str, list]:
     """
     Reads reservations from a file and returns the reservations converted
-    You don't need to modify this function!
+    into one list per column
 
     Parameters:
      reservation_file (str): Name of the file containing the reservations
 
     Returns:
-     reservations (list): Read and converted reservations
-    """
-    reservations = []
-    reservations.append(
-        [
-            "reservationId",
-            "name",
-            "email",
-            "phone",
-            "reservationDate",
-            "reservationTime",
-            "durationHours",
-            "price",
-            "confirmed",
-            "reservedResource",
-            "createdAt",
-        ]
-    )
-    with open(reservation_file, "r", encoding="utf-8") as f:
-        for line in f:
-            if len(line) > 1:
-                fields = line.split("|")
-                reservations.append(convert_reservation_data(fields))
+     reservations (dict): Read and converted reservations, one list per
+     column instead of one dictionary per row
+    """
+    # Store the data column-wise (struct of arrays): the report
+    # functions scan whole columns, so keeping each one contiguous
+    # beats allocating a hash table per reservation. The numeric
+    # columns are typed arrays, which pack the raw values directly
+    # instead of holding a pointer to a boxed object per row
+    reservations = {
+        "id": array("i"),
+        "name": [],
+        "email": [],
+        "phone": [],
+        "date": [],
+        "date_str": [],
+        "time": [],
+        "time_str": [],
+        "duration": array("i"),
+        "price": array("d"),
+        "confirmed": array("b"),
+        "resource": [],
+        "created": [],
+    }
+    # Read the file as raw bytes in one call and split the lines
+    # ourselves; text mode would decode every byte to str up front when
+    # only the few free-text fields actually need decoding
+    with open(reservation_file, "rb") as f:
+        raw = f.read()
+    for line in raw.split(b"\n"):
+        if len(line) > 1:
+            fields = line.split(b"|")
+            converted = convert_reservation_data(fields)
+            for key, value in converted.items():
+                reservations[key].append(value)
     return reservations
 
-def confirmed_reservations(reservations: list[dict]) -> None:
+def confirmed_reservations(reservations: dict[str, list]) -> None:
     """
     Print confirmed reservations
 
     Parameters:
-     reservations (list): Reservations, list of dictionaries
-    """
-    for reservation in reservations[1:]:
-        if reservation["confirmed"]: # If confirmed
-            print(f'- {reservation["name"]}, {reservation["resource"]}, {reservation["date"].strftime("%d.%m.%Y")} at {reservation["time"].strftime("%H.%M")}')
-
-def long_reservations(reservations : list[dict]) -> None:
+     reservations (dict): Reservation columns
+    """
+    # Collect the rows and write them in one call; a print per row
+    # flushes line by line through the interpreter's I/O machinery
+    lines = []
+    for name, resource, date_str, time_str, confirmed in zip(
+        reservations["name"], reservations["resource"], reservations["date_str"],
+        reservations["time_str"], reservations["confirmed"],
+    ):
+        if confirmed: # If confirmed
+            lines.append(f'- {name}, {resource}, {date_str} at {time_str}')
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+def long_reservations(reservations : dict[str, list]) -> None:
     """
     Print long reservations
 
     Parameters:
-     reservations (list): Reservations, list of dicitonaries
+     reservations (dict): Reservation columns
     """
-    for reservation in reservations[1:]:
-        if reservation["duration"] >= 3: # If long; changed from >3 to >=3 to conform to definition of long reservation
-            print(f'- {reservation["name"]}, {reservation["date"].strftime("%d.%m.%Y")} at {reservation["time"].strftime("%H.%M")}, duration {reservation["duration"]} h, {reservation["resource"]}')
+    lines = []
+    for name, date_str, time_str, duration, resource in zip(
+        reservations["name"], reservations["date_str"], reservations["time_str"],
+        reservations["duration"], reservations["resource"],
+    ):
+        if duration >= 3: # If long; changed from >3 to >=3 to conform to definition of long reservation
+            lines.append(f'- {name}, {date_str} at {time_str}, duration {duration} h, {resource}')
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
-def confirmation_statuses(reservations: list[dict]) -> None:
+def confirmation_statuses(reservations: dict[str, list]) -> None:
     """
     Print confirmation statuses
 
     Parameters:
-     reservations (list): Reservations, list of dictionaries
+     reservations (dict): Reservation columns
     """
-    for reservation in reservations[1:]:
-        name : str = reservation["name"]
-        confirmed : bool = reservation["confirmed"]
+    lines = []
+    for name, confirmed in zip(reservations["name"], reservations["confirmed"]):
+        lines.append(f'{name} → {"Confirmed" if confirmed else "NOT Confirmed"}')
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
-        print(f'{name} → {"Confirmed" if confirmed else "NOT Confirmed"}')
+# Cache for the confirmation aggregates; the reservations are loaded
+# once per run, so the shared walk only needs to happen once
+_aggregates_cache = None
+
+def _aggregate(reservations: dict[str, list]) -> tuple[int, float]:
+    """
+    Count the confirmed reservations and sum their revenue in one walk,
+    so the summary and revenue reports don't each scan the columns
 
-def confirmation_summary(reservations: list[dict]) -> None:
+    Parameters:
+     reservations (dict): Reservation columns
+
+    Returns:
+     (tuple): number of confirmed reservations and their total revenue
+    """
+    global _aggregates_cache
+    if _aggregates_cache is None:
+        confirmed = 0
+        revenue = 0.0
+        for duration, price, conf in zip(
+            reservations["duration"], reservations["price"], reservations["confirmed"]
+        ):
+            if conf:
+                confirmed += 1
+                revenue += duration * price
+        _aggregates_cache = (confirmed, revenue)
+    return _aggregates_cache
+
+def confirmation_summary(reservations: dict[str, list]) -> None:
     """
     Print confirmation summary
 
     Parameters:
-     reservations (list): Reservations, list of dictionaries
+     reservations (dict): Reservation columns
     """
-    confirmed : int = len([x for x in reservations[1:] if x["confirmed"]])
-    print(f'- Confirmed reservations: {confirmed} pcs\n- Not confirmed reservations: {len(reservations[1:]) - confirmed} pcs')
+    confirmed, _ = _aggregate(reservations)
+    print(f'- Confirmed reservations: {confirmed} pcs\n- Not confirmed reservations: {len(reservations["confirmed"]) - confirmed} pcs')
 
-def total_revenue(reservations: list[dict]) -> None:
+def total_revenue(reservations: dict[str, list]) -> None:
     """
     Print total revenue
 
     Parameters:
-     reservations (list): Reservations, list of dictionaries
+     reservations (dict): Reservation columns
     """
-    revenue : float = sum(x["duration"] * x["price"] for x in reservations[1:] if x["confirmed"])
+    _, revenue = _aggregate(reservations)
     print(f'Total revenue from confirmed reservations: {revenue:.2f} €'.replace('.', ','))
 
 def main():